@@ -11,6 +11,9 @@ from app.scheduler.post_scheduler import PostScheduler
 
 router = APIRouter()
 
+# Most posts a single /generate-images request may render
+MAX_IMAGE_BATCH_SIZE = 50
+
 @router.get("/", response_model=List[dict])
 async def get_posts(
     skip: int = 0, 
@@ -159,6 +162,89 @@ async def generate_post_image(
             detail=f"Error generating image: {str(e)}"
         )
 
+@router.post("/generate-images", response_model=dict)
+def generate_post_images(
+    data: dict,
+    db: Session = Depends(get_db)
+):
+    """Generate images for several posts in one batch.
+    
+    A plain def, so FastAPI runs the blocking render in its threadpool instead
+    of on the event loop.
+    """
+    post_ids = data.get("post_ids")
+    template_type_str = data.get("template_type", "general")
+    
+    if not post_ids or not isinstance(post_ids, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="post_ids must be a non-empty list"
+        )
+    
+    if len(post_ids) > MAX_IMAGE_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_IMAGE_BATCH_SIZE} posts can be rendered per request"
+        )
+    
+    # bool is an int subclass, but true/false are not post IDs
+    if not all(isinstance(post_id, int) and not isinstance(post_id, bool) for post_id in post_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="post_ids must contain only integer IDs"
+        )
+    
+    if not isinstance(template_type_str, str):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="template_type must be a string"
+        )
+    
+    posts = db.query(Post).filter(Post.id.in_(post_ids)).all()
+    missing_ids = set(post_ids) - {post.id for post in posts}
+    
+    if missing_ids:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Posts with IDs {sorted(missing_ids)} not found"
+        )
+    
+    try:
+        # Convert template type string to enum
+        try:
+            template_type = TemplateType(template_type_str.lower())
+        except ValueError:
+            template_type = TemplateType.GENERAL
+        
+        # Generate images
+        generator = ImageGenerator()
+        image_paths = generator.generate_images_for_posts(posts, template_type)
+        
+        # Update posts with image paths
+        images = []
+        failed_ids = []
+        for post, image_path in zip(posts, image_paths):
+            if not image_path:
+                failed_ids.append(post.id)
+                continue
+            post.image_path = image_path
+            db.add(post)
+            images.append({"post_id": post.id, "image_path": image_path})
+        db.commit()
+        
+        return {
+            "images": images,
+            "failed_post_ids": failed_ids,
+            "message": f"Successfully generated {len(images)} of {len(posts)} images"
+        }
+    
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error generating images: {str(e)}"
+        )
+
 @router.post("/{post_id}/schedule", response_model=dict)
 async def schedule_post(
     post_id: int,
@@ -46,12 +46,14 @@ class Settings(BaseModel):
     
     # Web scraping settings
     SCRAPE_INTERVAL: int = int(os.getenv("SCRAPE_INTERVAL", "3600"))
+    HTML_PARSER: str = os.getenv("HTML_PARSER", "html.parser")  # BeautifulSoup backend, e.g. "lxml"
     
     # Content settings
     MAX_POSTS_PER_DAY: int = int(os.getenv("MAX_POSTS_PER_DAY", "5"))
     
     # Image generation
     IMAGE_OUTPUT_DIR: str = os.getenv("IMAGE_OUTPUT_DIR", "data/images")
+    IMAGE_FORMAT: str = os.getenv("IMAGE_FORMAT", "png")  # "png" or "webp"
     DEFAULT_IMAGE_SIZE: tuple = (1200, 630)  # Default size for social media images
 
 # Instantiate settings
@@ -5,25 +5,58 @@ from typing import Dict, List, Optional, Tuple
 import logging
 from datetime import datetime
 import asyncio
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright, Browser, BrowserContext, Route, TimeoutError as PlaywrightTimeoutError
 from app.models.content import ContentType, ContentSource, ContentItem
+from app.config import settings
 from sqlalchemy.orm import Session
 import os
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Subresources that don't affect the text content of a page
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+async def _block_static_resources(route: Route) -> None:
+    """Abort requests for blocked resource types and let everything else through."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+async def new_browser_context(browser: Browser) -> BrowserContext:
+    """Open a browser context configured the way the scraper browses.
+    
+    Args:
+        browser: Launched Playwright browser
+        
+    Returns:
+        New BrowserContext
+    """
+    return await browser.new_context(
+        user_agent=USER_AGENT,
+        viewport={'width': 1280, 'height': 720}
+    )
+
 class WebScraper:
     """Web scraper for content ingestion."""
     
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, http_session: Optional[requests.Session] = None,
+                 html_parser: Optional[str] = None):
         """Initialize the scraper.
         
         Args:
             session: SQLAlchemy database session
+            http_session: HTTP session to fetch pages with, so callers can share
+                one connection pool across scrapers; plain requests.get is used if omitted
+            html_parser: BeautifulSoup parser backend; defaults to settings.HTML_PARSER
         """
         self.session = session
+        self.http_session = http_session
+        self.html_parser = html_parser or settings.HTML_PARSER
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': USER_AGENT
         }
     
     def scrape_website(self, source: ContentSource) -> List[ContentItem]:
@@ -71,7 +104,7 @@ class WebScraper:
             List of ContentItem objects
         """
         try:
-            response = requests.get(source.url, headers=self.headers, timeout=10)
+            response = (self.http_session or requests).get(source.url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
             return self._parse_html_content(source, response.text)
@@ -80,98 +113,121 @@ class WebScraper:
             logger.error(f"Error with requests scraper for {source.url}: {str(e)}")
             return []
     
-    async def _scrape_with_playwright(self, source: ContentSource) -> List[ContentItem]:
+    async def _scrape_with_playwright(self, source: ContentSource, context: Optional[BrowserContext] = None,
+                                      block_resources: bool = False) -> List[ContentItem]:
         """Scrape content using Playwright for JavaScript-rendered sites.
         
         Args:
             source: ContentSource object with website info
+            context: Browser context to open the page in; when omitted a
+                browser is launched for this call and closed afterwards
+            block_resources: Skip loading images, media, fonts and stylesheets.
+                Faster, but the debug screenshot will be unstyled
             
         Returns:
             List of ContentItem objects
         """
+        if context is not None:
+            return await self._scrape_in_context(source, context, block_resources)
+        
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=self.headers['User-Agent'],
-                viewport={'width': 1280, 'height': 720}
-            )
-            
-            page = await context.new_page()
-            
             try:
-                await page.goto(source.url, wait_until='networkidle', timeout=30000)
-                
-                # Wait for the page to load content - don't fail if selectors aren't found
-                selectors = ['p', 'article', 'div.content', 'main', '.post-content', '.entry-content']
-                
-                # Try each selector but don't throw an exception if not found
-                for selector in selectors:
-                    try:
-                        await page.wait_for_selector(selector, timeout=2000, state='attached')
-                        logger.info(f"Found selector {selector} on page")
-                        break
-                    except PlaywrightTimeoutError:
-                        logger.debug(f"Selector {selector} not found on page")
-                        continue
-                
-                # Wait a bit more for any JavaScript to finish executing
-                await asyncio.sleep(2)
-                
-                # Get the HTML content
-                html_content = await page.content()
-                
-                # Take a screenshot for debugging (optional)
-                screenshot_path = f"data/screenshots/{source.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.png"
-                os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
-                await page.screenshot(path=screenshot_path, full_page=True)
-                logger.info(f"Screenshot saved to {screenshot_path}")
-                
-                # Parse the HTML content
-                content_items = self._parse_html_content(source, html_content)
-                
-                # If no content found with general selectors, try extracting all text as a fallback
-                if not content_items:
-                    logger.info("No content found with standard parsing, extracting all page text")
-                    try:
-                        # Extract all text from the page using JavaScript
-                        all_text = await page.evaluate('''() => {
-                            const elements = document.querySelectorAll('h1, h2, h3, h4, h5, h6, p, li, span');
-                            return Array.from(elements)
-                                .map(el => el.textContent.trim())
-                                .filter(text => text.length > 20) // Only text with reasonable length
-                                .join('\\n\\n');
-                        }''')
-                        
-                        if all_text and len(all_text) > 100:  # Only if we got substantial text
-                            # Get the page title
-                            title = await page.title()
-                            
-                            # Create a content item with all text
-                            content_item = ContentItem(
-                                source_id=source.id,
-                                title=title or f"Content from {source.url}",
-                                content=all_text,
-                                url=source.url,
-                                ingested_at=datetime.utcnow(),
-                                meta_data={
-                                    "html_source": "javascript_extraction",
-                                    "extraction_method": "fullpage_text",
-                                    "screenshot_path": screenshot_path
-                                }
-                            )
-                            content_items.append(content_item)
-                    except Exception as js_error:
-                        logger.error(f"Error extracting text with JavaScript: {str(js_error)}")
-                
-                return content_items
-                
-            except Exception as e:
-                logger.error(f"Error with Playwright scraper for {source.url}: {str(e)}")
-                return []
-                
+                context = await new_browser_context(browser)
+                return await self._scrape_in_context(source, context, block_resources)
             finally:
                 await browser.close()
     
+    async def _scrape_in_context(self, source: ContentSource, context: BrowserContext,
+                                 block_resources: bool = False) -> List[ContentItem]:
+        """Scrape one page in an existing browser context.
+        
+        Args:
+            source: ContentSource object with website info
+            context: Browser context to open the page in
+            block_resources: Skip loading images, media, fonts and stylesheets
+            
+        Returns:
+            List of ContentItem objects
+        """
+        page = await context.new_page()
+        if block_resources:
+            await page.route("**/*", _block_static_resources)
+        
+        try:
+            await page.goto(source.url, wait_until='networkidle', timeout=30000)
+            
+            # Wait for the page to load content - don't fail if selectors aren't found
+            selectors = ['p', 'article', 'div.content', 'main', '.post-content', '.entry-content']
+            
+            # Try each selector but don't throw an exception if not found
+            for selector in selectors:
+                try:
+                    await page.wait_for_selector(selector, timeout=2000, state='attached')
+                    logger.info(f"Found selector {selector} on page")
+                    break
+                except PlaywrightTimeoutError:
+                    logger.debug(f"Selector {selector} not found on page")
+                    continue
+            
+            # Wait a bit more for any JavaScript to finish executing
+            await asyncio.sleep(2)
+            
+            # Get the HTML content
+            html_content = await page.content()
+            
+            # Take a screenshot for debugging (optional)
+            screenshot_path = f"data/screenshots/{source.id}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.png"
+            os.makedirs(os.path.dirname(screenshot_path), exist_ok=True)
+            await page.screenshot(path=screenshot_path, full_page=True)
+            logger.info(f"Screenshot saved to {screenshot_path}")
+            
+            # Parse the HTML content
+            content_items = self._parse_html_content(source, html_content)
+            
+            # If no content found with general selectors, try extracting all text as a fallback
+            if not content_items:
+                logger.info("No content found with standard parsing, extracting all page text")
+                try:
+                    # Extract all text from the page using JavaScript
+                    all_text = await page.evaluate('''() => {
+                        const elements = document.querySelectorAll('h1, h2, h3, h4, h5, h6, p, li, span');
+                        return Array.from(elements)
+                            .map(el => el.textContent.trim())
+                            .filter(text => text.length > 20) // Only text with reasonable length
+                            .join('\\n\\n');
+                    }''')
+                    
+                    if all_text and len(all_text) > 100:  # Only if we got substantial text
+                        # Get the page title
+                        title = await page.title()
+                        
+                        # Create a content item with all text
+                        content_item = ContentItem(
+                            source_id=source.id,
+                            title=title or f"Content from {source.url}",
+                            content=all_text,
+                            url=source.url,
+                            ingested_at=datetime.utcnow(),
+                            meta_data={
+                                "html_source": "javascript_extraction",
+                                "extraction_method": "fullpage_text",
+                                "screenshot_path": screenshot_path
+                            }
+                        )
+                        content_items.append(content_item)
+                except Exception as js_error:
+                    logger.error(f"Error extracting text with JavaScript: {str(js_error)}")
+            
+            return content_items
+            
+        except Exception as e:
+            logger.error(f"Error with Playwright scraper for {source.url}: {str(e)}")
+            return []
+            
+        finally:
+            await page.close()
+    
     def _parse_html_content(self, source: ContentSource, html_content: str) -> List[ContentItem]:
         """Parse HTML content to extract content items.
         
@@ -182,7 +238,7 @@ class WebScraper:
         Returns:
             List of ContentItem objects
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, self.html_parser)
         content_items = []
         
         # Try different content container patterns
@@ -292,10 +348,10 @@ class WebScraper:
             List of extracted URLs
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = (self.http_session or requests).get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, self.html_parser)
             base_url = f"{urlparse(url).scheme}://{urlparse(url).netloc}"
             
             links = []
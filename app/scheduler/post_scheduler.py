@@ -6,7 +6,7 @@ from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.pool import ThreadPoolExecutor
 from app.models.content import Post, ContentStatus, Platform
-from app.services.social_publisher import LinkedInPublisher, TwitterPublisher, InstagramPublisher
+from app.services.social_publisher import get_publisher
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -22,13 +22,6 @@ class PostScheduler:
         """
         self.db_session = db_session
         
-        # Initialize social media publishers
-        self.publishers = {
-            Platform.LINKEDIN: LinkedInPublisher(),
-            Platform.TWITTER: TwitterPublisher(),
-            Platform.INSTAGRAM: InstagramPublisher()
-        }
-        
         # Configure job stores and executors
         jobstores = {
             'default': SQLAlchemyJobStore(url=settings.DATABASE_URL)
@@ -187,7 +180,7 @@ class PostScheduler:
                 return False
             
             # Get the appropriate publisher for the platform
-            publisher = self.publishers.get(platform)
+            publisher = get_publisher(platform)
             
             if not publisher:
                 logger.error(f"No publisher available for platform {platform}")
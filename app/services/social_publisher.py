@@ -1,8 +1,14 @@
 import os
 import logging
 import json
+import asyncio
+import base64
+import functools
+import orjson
 import requests
-from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Iterable, List, Optional
 from datetime import datetime
 from abc import ABC, abstractmethod
 from app.models.content import Post, Platform
@@ -10,9 +16,67 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Status codes worth retrying; 429 and 503 usually come with a Retry-After header
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+# A POST creates a post, so it is only re-sent when the platform says it was not
+# processed at all; after a 500/502/504 or a read error it may already exist
+POST_RETRY_STATUS_CODES = frozenset({429, 503})
+# Longest Retry-After we sleep on; publishing runs on request threads
+MAX_RETRY_AFTER = 5
+# Connect/read timeout for every platform API call, in seconds
+REQUEST_TIMEOUT = 10
+# Raised when a well-formed JSON response has nulls or lists where objects are expected
+RESPONSE_SHAPE_ERRORS = (AttributeError, TypeError, IndexError, KeyError)
+
+class _PublisherRetry(Retry):
+    """Retry policy that never re-sends a POST the platform may have processed."""
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method == "POST":
+            return bool(self.total) and status_code in POST_RETRY_STATUS_CODES
+        return super().is_retry(method, status_code, has_retry_after)
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+    def get_backoff_time(self) -> float:
+        # Capped here rather than with backoff_max, which urllib3 1.26 lacks
+        return min(super().get_backoff_time(), MAX_RETRY_AFTER)
+
+def _build_session() -> requests.Session:
+    """Create an HTTP session that retries transient failures.
+    
+    Idempotent GET/DELETE requests are retried on transient statuses and
+    connection or read errors. POSTs are only retried when the connection
+    failed or the platform answered 429/503, i.e. nothing was created.
+    Retries back off exponentially and honour Retry-After up to
+    MAX_RETRY_AFTER seconds. Once retries are exhausted the last response is
+    returned so callers see the status code.
+    
+    Returns:
+        Configured requests session
+    """
+    retry = _PublisherRetry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "DELETE"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
 class SocialPublisher(ABC):
     """Abstract base class for social media publishers."""
     
+    # Platform name reported in result dictionaries
+    platform_name = ""
+    
     @abstractmethod
     def publish(self, post: Post) -> Dict[str, Any]:
         """Publish a post to a social media platform.
@@ -49,10 +113,43 @@ class SocialPublisher(ABC):
         """
         pass
 
+    def _err(self, error: str) -> Dict[str, Any]:
+        """Build a failure result.
+        
+        Args:
+            error: Error message
+            
+        Returns:
+            Dictionary with result information
+        """
+        return {
+            "success": False,
+            "error": error,
+            "platform": self.platform_name,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    def _json(response: requests.Response) -> Optional[Any]:
+        """Decode a JSON response body.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Decoded body or None if it is not valid JSON
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return None
+
 
 class LinkedInPublisher(SocialPublisher):
     """Publisher for LinkedIn posts."""
     
+    platform_name = "linkedin"
+    
     def __init__(self, access_token: Optional[str] = None):
         """Initialize the LinkedIn publisher.
         
@@ -65,6 +162,21 @@ class LinkedInPublisher(SocialPublisher):
         # Person/Organization URN (would be set from settings in a real app)
         # Format: urn:li:person:{id} or urn:li:organization:{id}
         self.author_urn = "urn:li:person:me"
+        
+        # Credentials don't change after construction
+        self._configured = bool(self.access_token)
+        
+        # Reuse connections across calls
+        self._session = _build_session()
+    
+        # Fixed endpoints and headers
+        self._url_ugc_posts = f"{self.api_url}/ugcPosts"
+        self._url_social_actions_prefix = f"{self.api_url}/socialActions/"
+        self._headers_read = {
+            "Authorization": f"Bearer {self.access_token}",
+            "X-Restli-Protocol-Version": "2.0.0"
+        }
+        self._headers_write = {**self._headers_read, "Content-Type": "application/json"}
     
     def publish(self, post: Post) -> Dict[str, Any]:
         """Publish a post to LinkedIn.
@@ -75,72 +187,56 @@ class LinkedInPublisher(SocialPublisher):
         Returns:
             Dictionary with result information
         """
-        if not self.access_token:
+        if not self._configured:
             return {"success": False, "error": "LinkedIn access token not configured"}
-        
-        try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "Content-Type": "application/json",
-                "X-Restli-Protocol-Version": "2.0.0"
-            }
             
-            # Define the post content
-            post_data = {
-                "author": self.author_urn,
-                "lifecycleState": "PUBLISHED",
-                "specificContent": {
-                    "com.linkedin.ugc.ShareContent": {
-                        "shareCommentary": {
-                            "text": post.text_content
-                        },
-                        "shareMediaCategory": "NONE"
-                    }
-                },
-                "visibility": {
-                    "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+        # Define the post content
+        post_data = {
+            "author": self.author_urn,
+            "lifecycleState": "PUBLISHED",
+            "specificContent": {
+                "com.linkedin.ugc.ShareContent": {
+                    "shareCommentary": {
+                        "text": post.text_content
+                    },
+                    "shareMediaCategory": "NONE"
                 }
+            },
+            "visibility": {
+                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
             }
+        }
             
-            # Add image if available
-            if post.image_path and os.path.exists(post.image_path):
-                # In a real implementation, this would handle image upload to LinkedIn
-                # For MVP, we'll just note that an image was included
-                post_data["specificContent"]["com.linkedin.ugc.ShareContent"]["shareMediaCategory"] = "IMAGE"
-                # The actual upload would involve multiple API calls to LinkedIn's media API
+        # Add image if available
+        if post.image_path and os.path.exists(post.image_path):
+            # In a real implementation, this would handle image upload to LinkedIn
+            # For MVP, we'll just note that an image was included
+            post_data["specificContent"]["com.linkedin.ugc.ShareContent"]["shareMediaCategory"] = "IMAGE"
+            # The actual upload would involve multiple API calls to LinkedIn's media API
             
-            # Make the API call to create the post
-            response = requests.post(
-                f"{self.api_url}/ugcPosts",
-                headers=headers,
-                json=post_data
+        # Make the API call to create the post
+        try:
+            response = self._session.post(
+                self._url_ugc_posts,
+                headers=self._headers_write,
+                json=post_data,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code == 201:
-                post_id = response.headers.get('x-restli-id')
-                return {
-                    "success": True,
-                    "post_id": post_id,
-                    "post_url": f"https://www.linkedin.com/feed/update/{post_id}",
-                    "platform": "linkedin",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"LinkedIn API error: {response.status_code} - {response.text}",
-                    "platform": "linkedin",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"Error publishing to LinkedIn: {str(e)}")
+            return self._err(str(e))
+            
+        if response.status_code == 201:
+            post_id = response.headers.get('x-restli-id')
             return {
-                "success": False,
-                "error": str(e),
+                "success": True,
+                "post_id": post_id,
+                "post_url": f"https://www.linkedin.com/feed/update/{post_id}",
                 "platform": "linkedin",
                 "timestamp": datetime.utcnow().isoformat()
             }
+        else:
+            return self._err(f"LinkedIn API error: {response.status_code} - {response.text}")
     
     def delete(self, post_id: str) -> Dict[str, Any]:
         """Delete a post from LinkedIn.
@@ -151,43 +247,28 @@ class LinkedInPublisher(SocialPublisher):
         Returns:
             Dictionary with result information
         """
-        if not self.access_token:
+        if not self._configured:
             return {"success": False, "error": "LinkedIn access token not configured"}
         
+        # Make the API call to delete the post
         try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Restli-Protocol-Version": "2.0.0"
-            }
-            
-            # Make the API call to delete the post
-            response = requests.delete(
-                f"{self.api_url}/ugcPosts/{post_id}",
-                headers=headers
+            response = self._session.delete(
+                f"{self._url_ugc_posts}/{post_id}",
+                headers=self._headers_read,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code == 204:
-                return {
-                    "success": True,
-                    "platform": "linkedin",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"LinkedIn API error: {response.status_code} - {response.text}",
-                    "platform": "linkedin",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"Error deleting LinkedIn post: {str(e)}")
+            return self._err(str(e))
+            
+        if response.status_code == 204:
             return {
-                "success": False,
-                "error": str(e),
+                "success": True,
                 "platform": "linkedin",
                 "timestamp": datetime.utcnow().isoformat()
             }
+        else:
+            return self._err(f"LinkedIn API error: {response.status_code} - {response.text}")
     
     def get_post_stats(self, post_id: str) -> Dict[str, Any]:
         """Get statistics for a LinkedIn post.
@@ -198,56 +279,54 @@ class LinkedInPublisher(SocialPublisher):
         Returns:
             Dictionary with statistics information
         """
-        if not self.access_token:
+        if not self._configured:
             return {"success": False, "error": "LinkedIn access token not configured"}
         
+        # Make the API call to get post statistics
+        # Note: LinkedIn's API for stats is more complex and may require multiple calls
+        # This is a simplified implementation
         try:
-            headers = {
-                "Authorization": f"Bearer {self.access_token}",
-                "X-Restli-Protocol-Version": "2.0.0"
-            }
-            
-            # Make the API call to get post statistics
-            # Note: LinkedIn's API for stats is more complex and may require multiple calls
-            # This is a simplified implementation
-            response = requests.get(
-                f"{self.api_url}/socialActions/{post_id}",
-                headers=headers
+            response = self._session.get(
+                f"{self._url_social_actions_prefix}{post_id}",
+                headers=self._headers_read,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "success": True,
-                    "stats": {
-                        "likes": data.get("likesSummary", {}).get("totalLikes", 0),
-                        "comments": data.get("commentsSummary", {}).get("totalComments", 0),
-                        "shares": data.get("sharesSummary", {}).get("totalShares", 0)
-                    },
-                    "platform": "linkedin",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"LinkedIn API error: {response.status_code} - {response.text}",
-                    "platform": "linkedin",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"Error getting LinkedIn post stats: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "platform": "linkedin",
-                "timestamp": datetime.utcnow().isoformat()
+            return self._err(str(e))
+            
+        if response.status_code != 200:
+            return self._err(f"LinkedIn API error: {response.status_code} - {response.text}")
+        
+        data = self._json(response)
+        if not isinstance(data, dict):
+            return self._err(f"LinkedIn API returned invalid JSON: {response.text}")
+        
+        try:
+            stats = {
+                "likes": data.get("likesSummary", {}).get("totalLikes", 0),
+                "comments": data.get("commentsSummary", {}).get("totalComments", 0),
+                "shares": data.get("sharesSummary", {}).get("totalShares", 0)
             }
+        except RESPONSE_SHAPE_ERRORS:
+            return self._err(f"LinkedIn API returned unexpected data: {response.text}")
+        
+        return {
+            "success": True,
+            "stats": stats,
+            "platform": "linkedin",
+            "timestamp": datetime.utcnow().isoformat()
+        }
 
 
 class TwitterPublisher(SocialPublisher):
     """Publisher for Twitter posts."""
     
+    platform_name = "twitter"
+    
+    # Maximum number of IDs accepted by the multi-tweet lookup endpoint
+    LOOKUP_BATCH_SIZE = 100
+    
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
                  access_token: Optional[str] = None, access_secret: Optional[str] = None):
         """Initialize the Twitter publisher.
@@ -263,6 +342,21 @@ class TwitterPublisher(SocialPublisher):
         self.access_token = access_token or settings.TWITTER_ACCESS_TOKEN
         self.access_secret = access_secret or settings.TWITTER_ACCESS_SECRET
         self.api_url = "https://api.twitter.com/2"
+        
+        # Credentials don't change after construction
+        self._configured = bool(self.api_key and self.api_secret and self.access_token and self.access_secret)
+        
+        # Reuse connections across calls
+        self._session = _build_session()
+    
+        # Fixed endpoints; bearer headers are built once a token is obtained
+        self._url_oauth_token = "https://api.twitter.com/oauth2/token"
+        self._url_tweets = f"{self.api_url}/tweets"
+        self._bearer_headers: Optional[Dict[str, str]] = None
+    
+        # App-only Basic credentials for the token endpoint
+        credentials = base64.b64encode(f"{self.api_key}:{self.api_secret}".encode()).decode()
+        self._auth_header = {"Authorization": f"Basic {credentials}"}
     
     def _get_bearer_token(self) -> Optional[str]:
         """Get a bearer token for Twitter API v2.
@@ -270,23 +364,52 @@ class TwitterPublisher(SocialPublisher):
         Returns:
             Bearer token or None if authentication failed
         """
-        try:
-            auth_url = "https://api.twitter.com/oauth2/token"
-            
-            auth = (self.api_key, self.api_secret)
-            data = {'grant_type': 'client_credentials'}
+        data = {'grant_type': 'client_credentials'}
             
-            response = requests.post(auth_url, auth=auth, data=data)
+        try:
+            response = self._session.post(self._url_oauth_token, headers=self._auth_header, data=data,
+                                          timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            logger.error(f"Error getting Twitter bearer token: {str(e)}")
+            return None
             
-            if response.status_code == 200:
-                return response.json().get('access_token')
-            else:
-                logger.error(f"Twitter authentication error: {response.status_code} - {response.text}")
-                return None
+        if response.status_code != 200:
+            logger.error(f"Twitter authentication error: {response.status_code} - {response.text}")
+            return None
                 
-        except Exception as e:
-            logger.error(f"Error getting Twitter bearer token: {str(e)}")
+        data = self._json(response)
+        if not isinstance(data, dict):
+            logger.error(f"Twitter authentication returned invalid JSON: {response.text}")
             return None
+        
+        return data.get('access_token')
+    
+    def _get_bearer_headers(self) -> Optional[Dict[str, str]]:
+        """Get request headers carrying the app bearer token.
+        
+        The token is requested once and reused until Twitter rejects it.
+        
+        Returns:
+            Headers dictionary or None if authentication failed
+        """
+        if self._bearer_headers is None:
+            bearer_token = self._get_bearer_token()
+            if not bearer_token:
+                return None
+            self._bearer_headers = {
+                "Authorization": f"Bearer {bearer_token}",
+                "Content-Type": "application/json"
+            }
+        return self._bearer_headers
+    
+    def _check_auth(self, response: requests.Response) -> None:
+        """Drop the cached bearer token if Twitter rejected it.
+        
+        Args:
+            response: HTTP response from the Twitter API
+        """
+        if response.status_code == 401:
+            self._bearer_headers = None
     
     def publish(self, post: Post) -> Dict[str, Any]:
         """Publish a post to Twitter.
@@ -297,72 +420,65 @@ class TwitterPublisher(SocialPublisher):
         Returns:
             Dictionary with result information
         """
-        if not all([self.api_key, self.api_secret, self.access_token, self.access_secret]):
+        if not self._configured:
             return {"success": False, "error": "Twitter API credentials not configured"}
         
-        try:
-            # For an actual implementation, we would use the Twitter API library
-            # and handle OAuth 1.0a authentication properly
-            # This is a simplified example using requests
+        # For an actual implementation, we would use the Twitter API library
+        # and handle OAuth 1.0a authentication properly
+        # This is a simplified example using requests
             
-            bearer_token = self._get_bearer_token()
+        headers = self._get_bearer_headers()
             
-            if not bearer_token:
-                return {"success": False, "error": "Failed to authenticate with Twitter"}
+        if not headers:
+            return {"success": False, "error": "Failed to authenticate with Twitter"}
             
-            headers = {
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json"
-            }
+        # Twitter has a character limit, so truncate if necessary
+        tweet_text = post.text_content
+        if len(tweet_text) > 280:
+            tweet_text = tweet_text[:277] + "..."
             
-            # Twitter has a character limit, so truncate if necessary
-            tweet_text = post.text_content
-            if len(tweet_text) > 280:
-                tweet_text = tweet_text[:277] + "..."
+        post_data = {
+            "text": tweet_text
+        }
             
-            post_data = {
-                "text": tweet_text
-            }
-            
-            # Add image if available (simplified)
-            if post.image_path and os.path.exists(post.image_path):
-                # In a real implementation, this would handle image upload to Twitter
-                # For MVP, we'll just note that an image was included
-                post_data["media"] = {"media_ids": ["placeholder_media_id"]}
+        # Add image if available (simplified)
+        if post.image_path and os.path.exists(post.image_path):
+            # In a real implementation, this would handle image upload to Twitter
+            # For MVP, we'll just note that an image was included
+            post_data["media"] = {"media_ids": ["placeholder_media_id"]}
             
-            # Make the API call to create the tweet
-            response = requests.post(
-                f"{self.api_url}/tweets",
+        # Make the API call to create the tweet
+        try:
+            response = self._session.post(
+                self._url_tweets,
                 headers=headers,
-                json=post_data
+                json=post_data,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code == 201:
-                data = response.json()
-                tweet_id = data.get("data", {}).get("id")
-                return {
-                    "success": True,
-                    "post_id": tweet_id,
-                    "post_url": f"https://twitter.com/user/status/{tweet_id}",
-                    "platform": "twitter",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Twitter API error: {response.status_code} - {response.text}",
-                    "platform": "twitter",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"Error publishing to Twitter: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "platform": "twitter",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return self._err(str(e))
+            
+        self._check_auth(response)
+        if response.status_code != 201:
+            return self._err(f"Twitter API error: {response.status_code} - {response.text}")
+        
+        data = self._json(response)
+        if not isinstance(data, dict):
+            return self._err(f"Twitter API returned invalid JSON: {response.text}")
+        
+        try:
+            tweet_id = data.get("data", {}).get("id")
+        except RESPONSE_SHAPE_ERRORS:
+            return self._err(f"Twitter API returned unexpected data: {response.text}")
+        
+        return {
+            "success": True,
+            "post_id": tweet_id,
+            "post_url": f"https://twitter.com/user/status/{tweet_id}",
+            "platform": "twitter",
+            "timestamp": datetime.utcnow().isoformat()
+        }
     
     def delete(self, post_id: str) -> Dict[str, Any]:
         """Delete a post from Twitter.
@@ -373,48 +489,34 @@ class TwitterPublisher(SocialPublisher):
         Returns:
             Dictionary with result information
         """
-        if not all([self.api_key, self.api_secret, self.access_token, self.access_secret]):
+        if not self._configured:
             return {"success": False, "error": "Twitter API credentials not configured"}
         
-        try:
-            bearer_token = self._get_bearer_token()
-            
-            if not bearer_token:
-                return {"success": False, "error": "Failed to authenticate with Twitter"}
+        headers = self._get_bearer_headers()
             
-            headers = {
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json"
-            }
+        if not headers:
+            return {"success": False, "error": "Failed to authenticate with Twitter"}
             
-            # Make the API call to delete the tweet
-            response = requests.delete(
-                f"{self.api_url}/tweets/{post_id}",
-                headers=headers
+        # Make the API call to delete the tweet
+        try:
+            response = self._session.delete(
+                f"{self._url_tweets}/{post_id}",
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "platform": "twitter",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Twitter API error: {response.status_code} - {response.text}",
-                    "platform": "twitter",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"Error deleting Twitter post: {str(e)}")
+            return self._err(str(e))
+            
+        self._check_auth(response)
+        if response.status_code == 200:
             return {
-                "success": False,
-                "error": str(e),
+                "success": True,
                 "platform": "twitter",
                 "timestamp": datetime.utcnow().isoformat()
             }
+        else:
+            return self._err(f"Twitter API error: {response.status_code} - {response.text}")
     
     def get_post_stats(self, post_id: str) -> Dict[str, Any]:
         """Get statistics for a Twitter post.
@@ -425,62 +527,125 @@ class TwitterPublisher(SocialPublisher):
         Returns:
             Dictionary with statistics information
         """
-        if not all([self.api_key, self.api_secret, self.access_token, self.access_secret]):
+        if not self._configured:
             return {"success": False, "error": "Twitter API credentials not configured"}
         
-        try:
-            bearer_token = self._get_bearer_token()
-            
-            if not bearer_token:
-                return {"success": False, "error": "Failed to authenticate with Twitter"}
+        headers = self._get_bearer_headers()
             
-            headers = {
-                "Authorization": f"Bearer {bearer_token}",
-                "Content-Type": "application/json"
-            }
+        if not headers:
+            return {"success": False, "error": "Failed to authenticate with Twitter"}
             
-            # Make the API call to get tweet metrics
-            response = requests.get(
-                f"{self.api_url}/tweets/{post_id}?tweet.fields=public_metrics",
-                headers=headers
+        # Make the API call to get tweet metrics
+        try:
+            response = self._session.get(
+                f"{self._url_tweets}/{post_id}?tweet.fields=public_metrics",
+                headers=headers,
+                timeout=REQUEST_TIMEOUT
             )
+        except requests.RequestException as e:
+            logger.error(f"Error getting Twitter post stats: {str(e)}")
+            return self._err(str(e))
             
-            if response.status_code == 200:
-                data = response.json()
-                metrics = data.get("data", {}).get("public_metrics", {})
-                
-                return {
-                    "success": True,
-                    "stats": {
-                        "likes": metrics.get("like_count", 0),
-                        "retweets": metrics.get("retweet_count", 0),
-                        "replies": metrics.get("reply_count", 0),
-                        "impressions": metrics.get("impression_count", 0)
-                    },
-                    "platform": "twitter",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Twitter API error: {response.status_code} - {response.text}",
-                    "platform": "twitter",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+        self._check_auth(response)
+        if response.status_code != 200:
+            return self._err(f"Twitter API error: {response.status_code} - {response.text}")
+        
+        data = self._json(response)
+        if not isinstance(data, dict):
+            return self._err(f"Twitter API returned invalid JSON: {response.text}")
+        
+        try:
+            stats = self._metrics_to_stats(data.get("data", {}).get("public_metrics", {}))
+        except RESPONSE_SHAPE_ERRORS:
+            return self._err(f"Twitter API returned unexpected data: {response.text}")
                 
-        except Exception as e:
-            logger.error(f"Error getting Twitter post stats: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "platform": "twitter",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+        return {
+            "success": True,
+            "stats": stats,
+            "platform": "twitter",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    def get_posts_stats(self, post_ids: List[str]) -> Dict[str, Any]:
+        """Get statistics for several Twitter posts.
+        
+        Uses the multi-tweet lookup endpoint, so up to 100 posts are fetched
+        per request instead of one request per post.
+        
+        Args:
+            post_ids: IDs of the posts to get stats for
+            
+        Returns:
+            Dictionary with statistics information keyed by post ID
+        """
+        if not self._configured:
+            return {"success": False, "error": "Twitter API credentials not configured"}
+        
+        headers = self._get_bearer_headers()
+        
+        if not headers:
+            return {"success": False, "error": "Failed to authenticate with Twitter"}
+        
+        stats = {}
+        for start in range(0, len(post_ids), self.LOOKUP_BATCH_SIZE):
+            batch = post_ids[start:start + self.LOOKUP_BATCH_SIZE]
+            
+            # Make the API call to get metrics for this batch of tweets
+            try:
+                response = self._session.get(
+                    self._url_tweets,
+                    headers=headers,
+                    params={"ids": ",".join(batch), "tweet.fields": "public_metrics"},
+                    timeout=REQUEST_TIMEOUT
+                )
+            except requests.RequestException as e:
+                logger.error(f"Error getting Twitter post stats: {str(e)}")
+                return self._err(str(e))
+            
+            self._check_auth(response)
+            if response.status_code != 200:
+                return self._err(f"Twitter API error: {response.status_code} - {response.text}")
+            
+            data = self._json(response)
+            if not isinstance(data, dict):
+                return self._err(f"Twitter API returned invalid JSON: {response.text}")
+            
+            try:
+                for tweet in data.get("data", []):
+                    stats[tweet.get("id")] = self._metrics_to_stats(tweet.get("public_metrics", {}))
+            except RESPONSE_SHAPE_ERRORS:
+                return self._err(f"Twitter API returned unexpected data: {response.text}")
+        
+        return {
+            "success": True,
+            "stats": stats,
+            "platform": "twitter",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    
+    @staticmethod
+    def _metrics_to_stats(metrics: Dict[str, Any]) -> Dict[str, int]:
+        """Convert Twitter public metrics to the stats format.
+        
+        Args:
+            metrics: public_metrics object from the Twitter API
+            
+        Returns:
+            Dictionary with statistics information
+        """
+        return {
+            "likes": metrics.get("like_count", 0),
+            "retweets": metrics.get("retweet_count", 0),
+            "replies": metrics.get("reply_count", 0),
+            "impressions": metrics.get("impression_count", 0)
+        }
 
 
 class InstagramPublisher(SocialPublisher):
     """Publisher for Instagram posts."""
     
+    platform_name = "instagram"
+    
     def __init__(self, client_id: Optional[str] = None, client_secret: Optional[str] = None,
                  access_token: Optional[str] = None):
         """Initialize the Instagram publisher.
@@ -494,6 +659,20 @@ class InstagramPublisher(SocialPublisher):
         self.client_secret = client_secret or settings.INSTAGRAM_CLIENT_SECRET
         self.access_token = access_token or settings.INSTAGRAM_ACCESS_TOKEN
         self.api_url = "https://graph.facebook.com/v18.0"  # Instagram Graph API is part of Facebook Graph API
+        
+        # Credentials don't change after construction
+        self._configured = bool(self.client_id and self.client_secret and self.access_token)
+        
+        # Reuse connections across calls
+        self._session = _build_session()
+    
+        # Fixed endpoints and query parameters
+        self._url_media_publish = f"{self.api_url}/me/media_publish"
+        self._params_auth = {"access_token": self.access_token}
+        self._params_stats = {
+            "access_token": self.access_token,
+            "fields": "insights.metric(engagement,impressions,reach,saved)"
+        }
     
     def publish(self, post: Post) -> Dict[str, Any]:
         """Publish a post to Instagram.
@@ -504,59 +683,52 @@ class InstagramPublisher(SocialPublisher):
         Returns:
             Dictionary with result information
         """
-        if not all([self.client_id, self.client_secret, self.access_token]):
+        if not self._configured:
             return {"success": False, "error": "Instagram API credentials not configured"}
         
-        try:
-            # Instagram requires an image for posts
-            if not post.image_path or not os.path.exists(post.image_path):
-                return {"success": False, "error": "Instagram posts require an image"}
-            
-            # For a real implementation, we would handle the Instagram Graph API properly
-            # This is a simplified example
-            
-            # Step 1: Upload photo to obtain a container ID
-            # In a real implementation, we would upload the image file
-            container_id = "placeholder_container_id"
-            
-            # Step 2: Publish the container with caption
-            params = {
-                "access_token": self.access_token,
-                "caption": post.text_content,
-                "container_id": container_id
-            }
+        # Instagram requires an image for posts
+        if not post.image_path or not os.path.exists(post.image_path):
+            return {"success": False, "error": "Instagram posts require an image"}
             
-            response = requests.post(
-                f"{self.api_url}/me/media_publish",
-                params=params
-            )
+        # For a real implementation, we would handle the Instagram Graph API properly
+        # This is a simplified example
             
-            if response.status_code == 200:
-                data = response.json()
-                post_id = data.get("id")
-                return {
-                    "success": True,
-                    "post_id": post_id,
-                    "post_url": f"https://www.instagram.com/p/{post_id}",
-                    "platform": "instagram",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Instagram API error: {response.status_code} - {response.text}",
-                    "platform": "instagram",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        # Step 1: Upload photo to obtain a container ID
+        # In a real implementation, we would upload the image file
+        container_id = "placeholder_container_id"
+            
+        # Step 2: Publish the container with caption
+        params = {
+            "access_token": self.access_token,
+            "caption": post.text_content,
+            "container_id": container_id
+        }
+            
+        try:
+            response = self._session.post(
+                self._url_media_publish,
+                params=params,
+                timeout=REQUEST_TIMEOUT
+            )
+        except requests.RequestException as e:
             logger.error(f"Error publishing to Instagram: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e),
-                "platform": "instagram",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return self._err(str(e))
+            
+        if response.status_code != 200:
+            return self._err(f"Instagram API error: {response.status_code} - {response.text}")
+        
+        data = self._json(response)
+        if not isinstance(data, dict):
+            return self._err(f"Instagram API returned invalid JSON: {response.text}")
+        
+        post_id = data.get("id")
+        return {
+            "success": True,
+            "post_id": post_id,
+            "post_url": f"https://www.instagram.com/p/{post_id}",
+            "platform": "instagram",
+            "timestamp": datetime.utcnow().isoformat()
+        }
     
     def delete(self, post_id: str) -> Dict[str, Any]:
         """Delete a post from Instagram.
@@ -567,41 +739,27 @@ class InstagramPublisher(SocialPublisher):
         Returns:
             Dictionary with result information
         """
-        if not all([self.client_id, self.client_secret, self.access_token]):
+        if not self._configured:
             return {"success": False, "error": "Instagram API credentials not configured"}
         
         try:
-            params = {
-                "access_token": self.access_token
-            }
-            
-            response = requests.delete(
+            response = self._session.delete(
                 f"{self.api_url}/{post_id}",
-                params=params
+                params=self._params_auth,
+                timeout=REQUEST_TIMEOUT
             )
-            
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "platform": "instagram",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Instagram API error: {response.status_code} - {response.text}",
-                    "platform": "instagram",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"Error deleting Instagram post: {str(e)}")
+            return self._err(str(e))
+            
+        if response.status_code == 200:
             return {
-                "success": False,
-                "error": str(e),
+                "success": True,
                 "platform": "instagram",
                 "timestamp": datetime.utcnow().isoformat()
             }
+        else:
+            return self._err(f"Instagram API error: {response.status_code} - {response.text}")
     
     def get_post_stats(self, post_id: str) -> Dict[str, Any]:
         """Get statistics for an Instagram post.
@@ -612,49 +770,106 @@ class InstagramPublisher(SocialPublisher):
         Returns:
             Dictionary with statistics information
         """
-        if not all([self.client_id, self.client_secret, self.access_token]):
+        if not self._configured:
             return {"success": False, "error": "Instagram API credentials not configured"}
         
         try:
-            params = {
-                "access_token": self.access_token,
-                "fields": "insights.metric(engagement,impressions,reach,saved)"
-            }
-            
-            response = requests.get(
+            response = self._session.get(
                 f"{self.api_url}/{post_id}",
-                params=params
+                params=self._params_stats,
+                timeout=REQUEST_TIMEOUT
             )
+        except requests.RequestException as e:
+            logger.error(f"Error getting Instagram post stats: {str(e)}")
+            return self._err(str(e))
             
-            if response.status_code == 200:
-                data = response.json()
-                insights = data.get("insights", {}).get("data", [])
-                
-                stats = {}
-                for metric in insights:
-                    metric_name = metric.get("name")
-                    metric_value = metric.get("values", [{}])[0].get("value", 0)
-                    stats[metric_name] = metric_value
-                
-                return {
-                    "success": True,
-                    "stats": stats,
-                    "platform": "instagram",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Instagram API error: {response.status_code} - {response.text}",
-                    "platform": "instagram",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
+        if response.status_code != 200:
+            return self._err(f"Instagram API error: {response.status_code} - {response.text}")
+        
+        data = self._json(response)
+        if not isinstance(data, dict):
+            return self._err(f"Instagram API returned invalid JSON: {response.text}")
+        
+        stats = {}
+        try:
+            for metric in data.get("insights", {}).get("data", []):
+                metric_name = metric.get("name")
+                metric_value = metric.get("values", [{}])[0].get("value", 0)
+                stats[metric_name] = metric_value
+        except RESPONSE_SHAPE_ERRORS:
+            return self._err(f"Instagram API returned unexpected data: {response.text}")
                 
-        except Exception as e:
-            logger.error(f"Error getting Instagram post stats: {str(e)}")
-            return {
+        return {
+            "success": True,
+            "stats": stats,
+            "platform": "instagram",
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+
+@functools.cache
+def _registry() -> Dict[Platform, SocialPublisher]:
+    """Build the shared publisher instances on first use.
+    
+    Returns:
+        Dictionary mapping platforms to their publisher
+    """
+    return {
+        Platform.LINKEDIN: LinkedInPublisher(),
+        Platform.TWITTER: TwitterPublisher(),
+        Platform.INSTAGRAM: InstagramPublisher()
+    }
+
+
+def get_publisher(platform: Platform) -> Optional[SocialPublisher]:
+    """Get the shared publisher for a platform.
+    
+    Args:
+        platform: Platform to publish to
+        
+    Returns:
+        Publisher instance or None if the platform is not supported
+    """
+    return _registry().get(platform)
+
+
+
+async def publish_to_all(post: Post, platforms: Iterable[Platform],
+                         max_concurrency: int = 8) -> Dict[Platform, Dict[str, Any]]:
+    """Publish a post to several platforms concurrently.
+    
+    Publishers are synchronous, so each call runs in a worker thread.
+    
+    Args:
+        post: Post to publish
+        platforms: Platforms to publish to
+        max_concurrency: Maximum number of publish calls in flight
+        
+    Returns:
+        Dictionary mapping each platform to its result information
+    """
+    platforms = list(dict.fromkeys(platforms))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def _publish(platform: Platform) -> Dict[str, Any]:
+        publisher = get_publisher(platform)
+        if not publisher:
+            return {"success": False, "error": f"No publisher available for platform {platform.value}"}
+        async with semaphore:
+            return await asyncio.to_thread(publisher.publish, post)
+    
+    results = await asyncio.gather(*(_publish(p) for p in platforms), return_exceptions=True)
+    
+    published = {}
+    for platform, result in zip(platforms, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error publishing to {platform.value}: {str(result)}")
+            result = {
                 "success": False,
-                "error": str(e),
-                "platform": "instagram",
+                "error": str(result),
+                "platform": platform.value,
                 "timestamp": datetime.utcnow().isoformat()
-            } 
\ No newline at end of file
+            }
+        published[platform] = result
+    
+    return published
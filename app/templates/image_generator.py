@@ -1,17 +1,163 @@
 import os
+import re
 import logging
+import functools
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from PIL import Image, ImageDraw, ImageFont
-import textwrap
 import random
-import uuid
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, repeat
+from types import SimpleNamespace
 from app.models.templates import Template, TemplateType
 from app.models.content import Post, ContentStatus
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of idle canvases kept per image size
+CANVAS_POOL_SIZE = 4
+
+# Render caches live at module level because callers create an ImageGenerator
+# per request. Static layout layers keyed by (layout, width, height, palette)
+_BACKGROUNDS: Dict[Tuple[Any, ...], Image.Image] = {}
+# Solid layers for overlays keyed by (size, color); they are never drawn on
+_SOLIDS: Dict[Tuple[Tuple[int, int], Tuple[int, int, int]], Image.Image] = {}
+# Idle canvases keyed by (width, height); each thread keeps its own so batch
+# workers never contend for them
+_CANVAS_LOCAL = threading.local()
+
+# Default templates as plain objects, so renders skip SQLAlchemy instance setup
+_DEFAULT_TEMPLATES: Dict[TemplateType, SimpleNamespace] = {
+    template_type: SimpleNamespace(
+        id=1,
+        name="Default Template",
+        template_type=template_type,
+        width=1200,
+        height=630,
+        is_active=True
+    )
+    for template_type in TemplateType
+}
+
+# Excerpt: first line longer than 20 characters that isn't a hashtag line
+_EXCERPT_RE = re.compile(r'^(?!#).{21,}$', re.M)
+# Quote: first line containing a double quote
+_QUOTE_RE = re.compile(r'^.*".*$', re.M)
+
+# Unique file name suffixes: a random tag picked once per process plus a counter
+_RUN_TAG = secrets.token_hex(4)
+_COUNTER = count()
+
+# Encoder settings per output format, tuned for encode speed over file size
+IMAGE_SAVE_OPTIONS = {
+    "png": ("PNG", {"compress_level": 1}),
+    "webp": ("WEBP", {"quality": 85, "method": 0})
+}
+
+@functools.lru_cache(maxsize=64)
+def _load_font(font_path: str, size: int) -> Optional[ImageFont.FreeTypeFont]:
+    """Load a font file, sharing the parsed font across the process.
+    
+    Args:
+        font_path: Path to the font file
+        size: Font size
+        
+    Returns:
+        PIL ImageFont object or None if loading fails
+    """
+    try:
+        if os.path.exists(font_path):
+            return ImageFont.truetype(font_path, size)
+        else:
+            logger.warning(f"Font file not found: {font_path}, using default font")
+            return ImageFont.load_default()
+    except Exception as e:
+        logger.error(f"Error loading font {font_path}: {str(e)}")
+        return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=4096)
+def _text_bbox(font: ImageFont.FreeTypeFont, text: str) -> Tuple[int, int, int, int]:
+    """Measure text, reusing results for strings rendered before.
+    
+    The cache holds a reference to the font, so entries stay valid.
+    
+    Args:
+        font: Font to measure with
+        text: Text to measure
+        
+    Returns:
+        Bounding box as (left, top, right, bottom)
+    """
+    return font.getbbox(text)
+
+def _split_long_word(font: ImageFont.FreeTypeFont, word: str, max_px: int) -> List[str]:
+    """Break a word into the fewest pieces that each fit within a pixel width.
+    
+    Args:
+        font: Font the text will be drawn with
+        word: Word wider than max_px
+        max_px: Maximum piece width in pixels
+        
+    Returns:
+        Pieces of the word, each at least one character long
+    """
+    pieces = []
+    start = 0
+    while start < len(word):
+        end = start + 1
+        while end < len(word) and font.getlength(word[start:end + 1]) <= max_px:
+            end += 1
+        pieces.append(word[start:end])
+        start = end
+    return pieces
+
+@functools.lru_cache(maxsize=1024)
+def _wrap_to_pixels(font: ImageFont.FreeTypeFont, text: str, max_px: int) -> Tuple[str, ...]:
+    """Greedily wrap text into lines no wider than a pixel width.
+    
+    Words wider than max_px (typically URLs) are broken between characters
+    so that every line fits.
+    
+    Args:
+        font: Font the text will be drawn with
+        text: Text to wrap
+        max_px: Maximum line width in pixels
+        
+    Returns:
+        Wrapped lines
+    """
+    space_w = font.getlength(" ")
+    lines = []
+    current = []
+    current_w = 0.0
+    for word in text.split():
+        word_w = font.getlength(word)
+        if word_w > max_px:
+            # Finish the current line, put the full-width pieces on lines of
+            # their own and carry the tail on like a normal word
+            if current:
+                lines.append(" ".join(current))
+            *full, word = _split_long_word(font, word, max_px)
+            lines.extend(full)
+            current = [word]
+            current_w = font.getlength(word)
+        elif current and current_w + space_w + word_w > max_px:
+            lines.append(" ".join(current))
+            current = [word]
+            current_w = word_w
+        elif current:
+            current.append(word)
+            current_w += space_w + word_w
+        else:
+            current = [word]
+            current_w = word_w
+    if current:
+        lines.append(" ".join(current))
+    return tuple(lines)
+
 class ImageGenerator:
     """Generator for social media post images using templates."""
     
@@ -28,6 +174,12 @@ class ImageGenerator:
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Output file format
+        self.image_format = settings.IMAGE_FORMAT.lower()
+        if self.image_format not in IMAGE_SAVE_OPTIONS:
+            logger.warning(f"Unsupported image format: {settings.IMAGE_FORMAT}, using png")
+            self.image_format = "png"
+        
         # Default brand colors
         self.colors = {
             "primary": (41, 128, 185),    # Blue
@@ -57,15 +209,7 @@ class ImageGenerator:
         Returns:
             PIL ImageFont object or None if loading fails
         """
-        try:
-            if os.path.exists(font_path):
-                return ImageFont.truetype(font_path, size)
-            else:
-                logger.warning(f"Font file not found: {font_path}, using default font")
-                return ImageFont.load_default()
-        except Exception as e:
-            logger.error(f"Error loading font {font_path}: {str(e)}")
-            return ImageFont.load_default()
+        return _load_font(font_path, size)
     
     def _create_blank_image(self, width: int, height: int, color: Tuple[int, int, int]) -> Image.Image:
         """Create a blank image with specified dimensions and color.
@@ -80,6 +224,123 @@ class ImageGenerator:
         """
         return Image.new("RGB", (width, height), color)
     
+    def _save_image(self, img: Image.Image, name: str) -> str:
+        """Save an image in the configured output format.
+        
+        Args:
+            img: PIL Image object
+            name: File name without extension
+            
+        Returns:
+            Path to the saved image
+        """
+        file_format, options = IMAGE_SAVE_OPTIONS[self.image_format]
+        file_path = os.path.join(self.output_dir, f"{name}.{self.image_format}")
+        img.save(file_path, file_format, **options)
+        return file_path
+    
+    def _quote_box(self, width: int, height: int) -> Tuple[int, int, int, int]:
+        """Get the geometry of the central box in the quote layout.
+        
+        Args:
+            width: Image width
+            height: Image height
+            
+        Returns:
+            Box (x, y, width, height)
+        """
+        return width // 8, height // 4, width * 3 // 4, height // 2
+    
+    def _build_background(self, layout: str, width: int, height: int) -> Image.Image:
+        """Draw the parts of a layout that do not depend on the post.
+        
+        Args:
+            layout: Layout name ("feature" or "quote")
+            width: Image width
+            height: Image height
+            
+        Returns:
+            PIL Image with the static layout
+        """
+        # Start from the layout's background color rather than painting over white
+        background_color = self.colors["light"] if layout == "quote" else self.colors["primary"]
+        img = self._create_blank_image(width, height, background_color)
+        draw = ImageDraw.Draw(img)
+        
+        if layout == "quote":
+            # Add central quote box
+            box_x, box_y, box_width, box_height = self._quote_box(width, height)
+            draw.rectangle(
+                [(box_x, box_y), (box_x + box_width, box_y + box_height)],
+                fill=self.colors["white"],
+                outline=self.colors["primary"],
+                width=3
+            )
+        else:
+            # Add accent bar
+            bar_width = 20
+            draw.rectangle([(0, 0), (bar_width, height)], fill=self.colors["accent"])
+        
+        return img
+    
+    def _get_background(self, layout: str, template: Template) -> Image.Image:
+        """Get the static layout for a template, building it on first use.
+        
+        Args:
+            layout: Layout name ("feature" or "quote")
+            template: Template to use
+            
+        Returns:
+            PIL Image with the static layout; must not be drawn on
+        """
+        key = (layout, template.width, template.height, tuple(self.colors.values()))
+        background = _BACKGROUNDS.get(key)
+        if background is None:
+            background = self._build_background(layout, template.width, template.height)
+            _BACKGROUNDS[key] = background
+        return background
+    
+    def _acquire_canvas(self, width: int, height: int) -> Tuple[Image.Image, ImageDraw.ImageDraw]:
+        """Take a canvas and its drawing context from the pool, creating them if none is idle.
+        
+        A reused canvas still holds its previous render, so callers must
+        paste a full-size background over it. Pasting writes into the same
+        buffer, so the drawing context stays bound to it.
+        
+        Args:
+            width: Image width
+            height: Image height
+            
+        Returns:
+            PIL Image object and an ImageDraw for it
+        """
+        idle = self._canvas_pool().get((width, height))
+        if idle:
+            return idle.pop()
+        img = self._create_blank_image(width, height, self.colors["white"])
+        return img, ImageDraw.Draw(img)
+    
+    def _release_canvas(self, canvas: Tuple[Image.Image, ImageDraw.ImageDraw]) -> None:
+        """Return a canvas to the pool once it has been saved.
+        
+        Args:
+            canvas: Canvas and drawing context obtained from _acquire_canvas
+        """
+        idle = self._canvas_pool().setdefault(canvas[0].size, [])
+        if len(idle) < CANVAS_POOL_SIZE:
+            idle.append(canvas)
+    
+    def _canvas_pool(self) -> Dict[Tuple[int, int], List[Tuple[Image.Image, ImageDraw.ImageDraw]]]:
+        """Get the calling thread's idle canvases.
+        
+        Returns:
+            Dictionary mapping (width, height) to idle canvases and their drawing contexts
+        """
+        pool = getattr(_CANVAS_LOCAL, "canvases", None)
+        if pool is None:
+            pool = _CANVAS_LOCAL.canvases = {}
+        return pool
+    
     def _add_text(self, 
                   draw: ImageDraw.ImageDraw, 
                   text: str, 
@@ -105,12 +366,13 @@ class ImageGenerator:
         x, y = position
         if not max_width:
             draw.text(position, text, font=font, fill=color)
-            return y + font.getbbox(text)[3] + 10
+            return y + _text_bbox(font, text)[3] + 10
         
         # Wrap text
-        lines = textwrap.wrap(text, width=max_width)
+        lines = _wrap_to_pixels(font, text, max_width)
         for line in lines:
-            line_width = font.getbbox(line)[2]
+            bbox = _text_bbox(font, line)
+            line_width = bbox[2]
             
             # Calculate position based on alignment
             if alignment == "center":
@@ -121,7 +383,7 @@ class ImageGenerator:
                 line_x = x
             
             draw.text((line_x, y), line, font=font, fill=color)
-            y += font.getbbox(line)[3] + 5
+            y += bbox[3] + 5
         
         return y + 10
     
@@ -135,8 +397,17 @@ class ImageGenerator:
         Returns:
             PIL Image with overlay
         """
-        overlay = Image.new("RGBA", image.size, (0, 0, 0, int(255 * opacity)))
-        return Image.alpha_composite(image.convert("RGBA"), overlay).convert("RGB")
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        
+        key = (image.size, self.colors["black"])
+        solid = _SOLIDS.get(key)
+        if solid is None:
+            solid = self._create_blank_image(image.width, image.height, self.colors["black"])
+            _SOLIDS[key] = solid
+        
+        # Blending towards black is the same as compositing a uniform black overlay
+        return Image.blend(image, solid, opacity)
     
     def generate_feature_image(self, post: Post, template: Template) -> str:
         """Generate a feature showcase image.
@@ -148,33 +419,24 @@ class ImageGenerator:
         Returns:
             Path to the generated image
         """
+        canvas = None
         try:
             # Create base image
             width = template.width
             height = template.height
-            img = self._create_blank_image(width, height, self.colors["white"])
-            draw = ImageDraw.Draw(img)
-            
-            # Add color background
-            draw.rectangle([(0, 0), (width, height)], fill=self.colors["primary"])
-            
-            # Add accent bar
-            bar_width = 20
-            draw.rectangle([(0, 0), (bar_width, height)], fill=self.colors["accent"])
+            canvas = self._acquire_canvas(width, height)
+            img, draw = canvas
+            img.paste(self._get_background("feature", template))
             
             # Extract title and short excerpt from post text
-            text_parts = post.text_content.split('\n')
-            title = text_parts[0] if text_parts else "Feature Highlight"
+            title, has_more, rest = post.text_content.partition('\n')
             
-            # Find a good excerpt
-            excerpt = ""
-            for part in text_parts[1:]:
-                if len(part) > 20 and not part.startswith('#'):
-                    excerpt = part
-                    break
+            # Find a good excerpt, scanning from the line after the title
+            match = _EXCERPT_RE.search(post.text_content, len(title) + 1) if has_more else None
+            excerpt = match.group() if match else ""
             
-            if not excerpt and len(text_parts) > 1:
-                excerpt = text_parts[1]
+            if not excerpt and has_more:
+                excerpt = rest.partition('\n')[0]
             
             # Add title
             title_y = 60
@@ -184,7 +446,7 @@ class ImageGenerator:
                 (width // 2, title_y), 
                 self.default_fonts["title"], 
                 self.colors["white"],
-                max_width=30,
+                max_width=width * 2 // 3,
                 alignment="center"
             )
             
@@ -202,7 +464,7 @@ class ImageGenerator:
                     (width // 2, excerpt_y), 
                     self.default_fonts["body"], 
                     self.colors["light"],
-                    max_width=40,
+                    max_width=width * 2 // 3,
                     alignment="center"
                 )
             
@@ -219,9 +481,7 @@ class ImageGenerator:
             )
             
             # Save the image
-            file_name = f"post_{post.id}_{uuid.uuid4().hex[:8]}.png"
-            file_path = os.path.join(self.output_dir, file_name)
-            img.save(file_path, "PNG")
+            file_path = self._save_image(img, f"post_{post.id}_{_RUN_TAG}{next(_COUNTER):x}")
             
             return file_path
             
@@ -229,6 +489,10 @@ class ImageGenerator:
             logger.error(f"Error generating feature image: {str(e)}")
             return ""
     
+        finally:
+            if canvas is not None:
+                self._release_canvas(canvas)
+    
     def generate_quote_image(self, post: Post, template: Template) -> str:
         """Generate a quote/testimonial image.
         
@@ -239,30 +503,25 @@ class ImageGenerator:
         Returns:
             Path to the generated image
         """
+        canvas = None
         try:
             # Create base image
             width = template.width
             height = template.height
-            img = self._create_blank_image(width, height, self.colors["white"])
-            draw = ImageDraw.Draw(img)
-            
-            # Add background color
-            draw.rectangle([(0, 0), (width, height)], fill=self.colors["light"])
-            
-            # Extract quote from post text
-            text_parts = post.text_content.split('\n')
+            canvas = self._acquire_canvas(width, height)
+            img, draw = canvas
+            img.paste(self._get_background("quote", template))
             
             # Try to find a good quote in the post
             quote = ""
             author = "Industry Expert"
             
-            for part in text_parts:
-                if '"' in part or '"' in part or '"' in part:
-                    quote = part.replace('"', '').replace('"', '').replace('"', '').strip()
-                    break
+            match = _QUOTE_RE.search(post.text_content)
+            if match:
+                quote = match.group().replace('"', '').strip()
             
-            if not quote and len(text_parts) > 0:
-                quote = text_parts[0]
+            if not quote:
+                quote = post.text_content.partition('\n')[0]
             
             # Add quotation mark
             quote_mark_size = 120
@@ -276,19 +535,9 @@ class ImageGenerator:
                 alignment="center"
             )
             
-            # Add central quote box
+            # Central quote box is part of the background
             box_padding = 40
-            box_x = width // 8
-            box_y = height // 4
-            box_width = width * 3 // 4
-            box_height = height // 2
-            
-            draw.rectangle(
-                [(box_x, box_y), (box_x + box_width, box_y + box_height)], 
-                fill=self.colors["white"],
-                outline=self.colors["primary"],
-                width=3
-            )
+            box_x, box_y, box_width, box_height = self._quote_box(width, height)
             
             # Add quote text
             quote_y = box_y + box_padding
@@ -298,7 +547,7 @@ class ImageGenerator:
                 (width // 2, quote_y), 
                 self.default_fonts["subtitle"], 
                 self.colors["dark"],
-                max_width=30,
+                max_width=box_width - 2 * box_padding,
                 alignment="center"
             )
             
@@ -326,9 +575,7 @@ class ImageGenerator:
             )
             
             # Save the image
-            file_name = f"quote_{post.id}_{uuid.uuid4().hex[:8]}.png"
-            file_path = os.path.join(self.output_dir, file_name)
-            img.save(file_path, "PNG")
+            file_path = self._save_image(img, f"quote_{post.id}_{_RUN_TAG}{next(_COUNTER):x}")
             
             return file_path
             
@@ -336,6 +583,10 @@ class ImageGenerator:
             logger.error(f"Error generating quote image: {str(e)}")
             return ""
     
+        finally:
+            if canvas is not None:
+                self._release_canvas(canvas)
+    
     def generate_image_for_post(self, post: Post, template_type: TemplateType = TemplateType.GENERAL) -> str:
         """Generate an image for a post based on template type.
         
@@ -346,15 +597,8 @@ class ImageGenerator:
         Returns:
             Path to the generated image
         """
-        # Create a default template (in a real app, this would come from the database)
-        template = Template(
-            id=1,
-            name="Default Template",
-            template_type=template_type,
-            width=1200,
-            height=630,
-            is_active=True
-        )
+        # Use a default template (in a real app, this would come from the database)
+        template = _DEFAULT_TEMPLATES[template_type]
         
         # Generate image based on template type
         if template_type == TemplateType.FEATURE_SHOWCASE:
@@ -363,4 +607,24 @@ class ImageGenerator:
             return self.generate_quote_image(post, template)
         else:
             # Default to feature image for other types
-            return self.generate_feature_image(post, template) 
\ No newline at end of file
+            return self.generate_feature_image(post, template)
+    
+    def generate_images_for_posts(self, posts: List[Post], template_type: TemplateType = TemplateType.GENERAL) -> List[str]:
+        """Generate images for several posts in parallel.
+        
+        Pillow releases the GIL while drawing and encoding, so renders
+        scale across worker threads.
+        
+        Args:
+            posts: Posts to generate images for
+            template_type: Type of template to use
+            
+        Returns:
+            Paths to the generated images, in the same order as posts
+        """
+        if not posts:
+            return []
+        
+        max_workers = min(len(posts), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.generate_image_for_post, posts, repeat(template_type)))
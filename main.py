@@ -7,4 +7,12 @@ from app.api.app import app
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run("app.api.app:app", host="0.0.0.0", port=port, reload=True) 
\ No newline at end of file
+    # Auto-reload runs a file watcher, so it is opt-in for local development
+    reload = os.getenv("UVICORN_RELOAD", "0") == "1"
+    uvicorn.run(
+        "app.api.app:app",
+        host="0.0.0.0",
+        port=port,
+        reload=reload,
+        workers=int(os.getenv("WORKERS", "1"))
+    ) 
\ No newline at end of file
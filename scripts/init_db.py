@@ -24,7 +24,7 @@ def init_db():
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=engine)
     
-    db = SessionLocal()
+    db = SessionLocal(expire_on_commit=False)
     try:
         # Check if we already have data
         existing_sources = db.query(ContentSource).count()
@@ -34,40 +34,41 @@ def init_db():
         
         logger.info("Adding test data...")
         
-        # Add content sources
+        now = datetime.utcnow()
+        
+        # Add content sources (plain mappings skip per-object ORM bookkeeping)
         sources = [
-            ContentSource(
+            dict(
                 name="Company Blog",
                 url="https://example.com/blog",
                 content_type=ContentType.BLOG,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
-            ContentSource(
+            dict(
                 name="Product Documentation",
                 url="https://example.com/docs",
                 content_type=ContentType.DOCUMENT,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
-            ContentSource(
+            dict(
                 name="Case Studies",
                 url="https://example.com/case-studies",
                 content_type=ContentType.CASE_STUDY,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             )
         ]
         
-        db.add_all(sources)
-        db.commit()
+        db.bulk_insert_mappings(ContentSource, sources)
         
         # Add content items
         content_items = [
-            ContentItem(
+            dict(
                 source_id=1,
                 title="Introducing Our New AI Feature",
                 content="""
@@ -86,7 +87,7 @@ def init_db():
                 Try it today and transform your workflow!
                 """,
                 url="https://example.com/blog/new-ai-feature",
-                ingested_at=datetime.utcnow(),
+                ingested_at=now,
                 meta_data={
                     "classification": {
                         "primary_category": "product",
@@ -97,7 +98,7 @@ def init_db():
                     }
                 }
             ),
-            ContentItem(
+            dict(
                 source_id=2,
                 title="Implementation Guide",
                 content="""
@@ -126,7 +127,7 @@ def init_db():
                 Connect with your existing systems through our API...
                 """,
                 url="https://example.com/docs/implementation-guide",
-                ingested_at=datetime.utcnow(),
+                ingested_at=now,
                 meta_data={
                     "classification": {
                         "primary_category": "educational",
@@ -137,7 +138,7 @@ def init_db():
                     }
                 }
             ),
-            ContentItem(
+            dict(
                 source_id=3,
                 title="Global Shipping Company Success Story",
                 content="""
@@ -169,7 +170,7 @@ def init_db():
                 * ROI within 6 months
                 """,
                 url="https://example.com/case-studies/global-shipping",
-                ingested_at=datetime.utcnow(),
+                ingested_at=now,
                 meta_data={
                     "classification": {
                         "primary_category": "case_study",
@@ -182,12 +183,11 @@ def init_db():
             )
         ]
         
-        db.add_all(content_items)
-        db.commit()
+        db.bulk_insert_mappings(ContentItem, content_items)
         
         # Add posts
         posts = [
-            Post(
+            dict(
                 content_item_id=1,
                 text_content="""Exciting announcement! 🚀 We've just launched our new AI-powered feature!
 
@@ -203,18 +203,18 @@ Learn more: https://example.com/blog/new-ai-feature
 #AIInnovation #ProductivityTools #MachineLearning""",
                 status=ContentStatus.DRAFT,
                 platform=Platform.LINKEDIN,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
-            Post(
+            dict(
                 content_item_id=1,
                 text_content="""Just launched: Our new AI feature saves customers 40% processing time while boosting accuracy by 85%! See how it works: https://example.com/blog/new-ai-feature #AI #Innovation""",
                 status=ContentStatus.DRAFT,
                 platform=Platform.TWITTER,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             ),
-            Post(
+            dict(
                 content_item_id=3,
                 text_content="""💼 SUCCESS STORY: Global Shipping Transformation
 
@@ -233,25 +233,24 @@ Want similar results for your business? Let's talk!
 #SupplyChain #Logistics #DigitalTransformation #BusinessSuccess #ShippingIndustry""",
                 status=ContentStatus.DRAFT,
                 platform=Platform.LINKEDIN,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
+                created_at=now,
+                updated_at=now
             )
         ]
         
-        db.add_all(posts)
-        db.commit()
+        db.bulk_insert_mappings(Post, posts)
         
         # Add templates
         templates = [
-            Template(
+            dict(
                 name="Blue Feature Showcase",
                 description="Blue-themed template for feature announcements",
                 template_type=TemplateType.FEATURE_SHOWCASE,
                 width=1200,
                 height=630,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
                 meta_data={
                     "colors": {
                         "primary": "#2980b9",
@@ -265,15 +264,15 @@ Want similar results for your business? Let's talk!
                     }
                 }
             ),
-            Template(
+            dict(
                 name="Green Testimonial",
                 description="Green-themed template for quotes and testimonials",
                 template_type=TemplateType.TESTIMONIAL,
                 width=1200,
                 height=630,
                 is_active=True,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
+                created_at=now,
+                updated_at=now,
                 meta_data={
                     "colors": {
                         "primary": "#27ae60",
@@ -289,7 +288,9 @@ Want similar results for your business? Let's talk!
             )
         ]
         
-        db.add_all(templates)
+        db.bulk_insert_mappings(Template, templates)
+        
+        # Everything is written in one transaction
         db.commit()
         
         logger.info("Database initialized successfully with test data.")
@@ -5,21 +5,23 @@ Test script to verify API endpoints
 import requests
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def test_api():
-    """Test API endpoints"""
-    BASE_URL = "http://localhost:8000/api"
-    
-    print("Testing API...")
-    
+def _check_health(s, base_url):
+    """Hit the health endpoint, returning the lines to print"""
+    out = []
     # Test 1: Health check endpoint
     try:
-        response = requests.get(f"{BASE_URL.split('/api')[0]}/health")
-        print(f"Health check: {response.status_code}")
-        print(response.json())
+        response = s.get(f"{base_url.split('/api')[0]}/health")
+        out.append(f"Health check: {response.status_code}")
+        out.append(str(response.json()))
     except Exception as e:
-        print(f"Health check error: {str(e)}")
-    
+        out.append(f"Health check error: {str(e)}")
+    return out
+
+def _check_content_flow(s, base_url):
+    """Create a source, ingest it, list its items and generate a post, returning the lines to print"""
+    out = []
     # Test 2: Create content source
     try:
         source_data = {
@@ -28,9 +30,9 @@ def test_api():
             "content_type": "website",
             "is_active": True
         }
-        response = requests.post(f"{BASE_URL}/content/sources", json=source_data)
-        print(f"Create content source: {response.status_code}")
-        print(json.dumps(response.json(), indent=2))
+        response = s.post(f"{base_url}/content/sources", json=source_data)
+        out.append(f"Create content source: {response.status_code}")
+        out.append(json.dumps(response.json(), indent=2))
         
         # If successful, get the source ID for further tests
         if response.status_code in (200, 201):
@@ -38,18 +40,18 @@ def test_api():
             
             # Test 3: Ingest content
             try:
-                response = requests.post(f"{BASE_URL}/content/sources/{source_id}/ingest")
-                print(f"Ingest content: {response.status_code}")
-                print(json.dumps(response.json(), indent=2))
+                response = s.post(f"{base_url}/content/sources/{source_id}/ingest")
+                out.append(f"Ingest content: {response.status_code}")
+                out.append(json.dumps(response.json(), indent=2))
             except Exception as e:
-                print(f"Ingest content error: {str(e)}")
+                out.append(f"Ingest content error: {str(e)}")
             
             # Test 4: Get content items
             try:
-                response = requests.get(f"{BASE_URL}/content/items", params={"source_id": source_id})
-                print(f"Get content items: {response.status_code}")
+                response = s.get(f"{base_url}/content/items", params={"source_id": source_id})
+                out.append(f"Get content items: {response.status_code}")
                 content_items = response.json()
-                print(f"Number of items: {len(content_items)}")
+                out.append(f"Number of items: {len(content_items)}")
                 
                 # If we have content items, test post generation
                 if content_items:
@@ -61,15 +63,33 @@ def test_api():
                             "content_item_id": content_item_id,
                             "platform": "linkedin"
                         }
-                        response = requests.post(f"{BASE_URL}/posts/generate", json=post_data)
-                        print(f"Generate post: {response.status_code}")
-                        print(json.dumps(response.json(), indent=2))
+                        response = s.post(f"{base_url}/posts/generate", json=post_data)
+                        out.append(f"Generate post: {response.status_code}")
+                        out.append(json.dumps(response.json(), indent=2))
                     except Exception as e:
-                        print(f"Generate post error: {str(e)}")
+                        out.append(f"Generate post error: {str(e)}")
             except Exception as e:
-                print(f"Get content items error: {str(e)}")
+                out.append(f"Get content items error: {str(e)}")
     except Exception as e:
-        print(f"Create content source error: {str(e)}")
+        out.append(f"Create content source error: {str(e)}")
+    return out
+
+def test_api():
+    """Test API endpoints"""
+    BASE_URL = "http://localhost:8000/api"
+    
+    # One session keeps the connection to the API alive between requests
+    s = requests.Session()
+    s.headers.update({"Content-Type": "application/json"})
+    
+    print("Testing API...")
+    
+    # The health check is independent of the create -> ingest -> items -> generate
+    # chain, so both run at once; each prints its output as a block when it finishes
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futures = [ex.submit(_check_health, s, BASE_URL), ex.submit(_check_content_flow, s, BASE_URL)]
+        for future in as_completed(futures):
+            print("\n".join(future.result()))
 
 if __name__ == "__main__":
     test_api() 
\ No newline at end of file
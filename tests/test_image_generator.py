@@ -0,0 +1,40 @@
+from PIL import ImageFont
+import pytest
+from app.templates.image_generator import _split_long_word, _wrap_to_pixels
+
+URL = "https://example.com/articles/2024/a-very-long-slug-that-never-breaks?utm_source=newsletter"
+
+@pytest.fixture(scope="module")
+def font():
+    """Pillow's bundled font, so the tests don't depend on system fonts."""
+    return ImageFont.load_default()
+
+@pytest.mark.parametrize("text", [
+    "Short text",
+    "A longer sentence that needs to be wrapped across several lines of output",
+    f"Read more at {URL} today",
+    URL,
+    f"{URL} {URL}",
+])
+@pytest.mark.parametrize("max_px", [40, 120, 300])
+def test_wrap_to_pixels_fits(font, text, max_px):
+    """Test that wrapped lines fit the width and keep every character."""
+    lines = _wrap_to_pixels(font, text, max_px)
+    assert all(font.getlength(line) <= max_px for line in lines)
+    assert "".join(lines).replace(" ", "") == text.replace(" ", "")
+
+def test_wrap_to_pixels_splits_url(font):
+    """Test that a URL wider than the line is broken across lines."""
+    max_px = 120
+    assert font.getlength(URL) > max_px
+    lines = _wrap_to_pixels(font, URL, max_px)
+    assert len(lines) > 1
+    assert "".join(lines) == URL
+
+def test_split_long_word(font):
+    """Test that a long word is split into fitting, non-empty pieces."""
+    max_px = 60
+    pieces = _split_long_word(font, URL, max_px)
+    assert len(pieces) > 1
+    assert all(piece and font.getlength(piece) <= max_px for piece in pieces)
+    assert "".join(pieces) == URL
@@ -0,0 +1,76 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
+from app.services.social_publisher import MAX_RETRY_AFTER, REQUEST_TIMEOUT, _build_session
+
+class _StatusHandler(BaseHTTPRequestHandler):
+    """Answer every request with the status code given in the path, e.g. /503?retry_after=1."""
+
+    def _respond(self):
+        self.server.hits += 1
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        url = urlsplit(self.path)
+        self.send_response(int(url.path.strip("/")))
+        for retry_after in parse_qs(url.query).get("retry_after", []):
+            self.send_header("Retry-After", retry_after)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    do_GET = do_POST = do_DELETE = _respond
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture(scope="module")
+def server():
+    """A local HTTP server that returns whatever status it is asked for."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StatusHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry sleeps instead of waiting them out."""
+    recorded = []
+    monkeypatch.setattr("urllib3.util.retry.time.sleep", recorded.append)
+    return recorded
+
+def _send(server, method, path):
+    """Send a request through a publisher session and return (status, requests received)."""
+    session = _build_session()
+    # The publisher only mounts its retrying adapter for https
+    session.mount("http://", session.get_adapter("https://"))
+    server.hits = 0
+    with session:
+        response = session.request(
+            method, f"http://127.0.0.1:{server.server_port}{path}", timeout=REQUEST_TIMEOUT
+        )
+    return response.status_code, server.hits
+
+@pytest.mark.parametrize("status", [500, 502])
+def test_post_not_retried_on_server_error(server, sleeps, status):
+    """Test that a POST the platform may have processed is sent only once."""
+    assert _send(server, "POST", f"/{status}") == (status, 1)
+
+@pytest.mark.parametrize("method,status", [
+    ("POST", 429),
+    ("POST", 503),
+    ("GET", 500),
+    ("GET", 502),
+    ("DELETE", 504),
+])
+def test_transient_status_retried(server, sleeps, method, status):
+    """Test that retryable responses are retried until retries run out."""
+    assert _send(server, method, f"/{status}") == (status, 4)
+
+def test_retry_after_capped(server, sleeps):
+    """Test that a long Retry-After is not slept on in full."""
+    assert _send(server, "POST", "/503?retry_after=21600") == (503, 4)
+    assert sleeps
+    assert max(sleeps) <= MAX_RETRY_AFTER